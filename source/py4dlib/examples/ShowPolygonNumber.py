@@ -50,15 +50,16 @@ if DEBUG:
 
 
 from py4dlib.maths import BuildMatrix3, IsZeroVector, BBox
-from py4dlib.mesh import CalcPolyNormal, CalcPolyCentroid, CalcPolyArea, PolyToListList
+from py4dlib.mesh import CalcPolyNCA, PolyToList, PolyToListList
 from py4dlib.mesh import GetSelectedPoints, GetSelectedPolys
-from py4dlib.objects import CreateObject, InsertUnderNull
+from py4dlib.objects import CreateObject, InsertUnderNull, NameIndex
 from py4dlib.utils import ClearConsole, PPLLString
 
 
 # group text spline objects under op else insert at root
 GROUP_UNDER = True
 TEXT_SIZE = 1
+AXIS_ZY = 1
 
 def main(doc):  # IGNORE:W0621
     doc.StartUndo()
@@ -68,6 +69,10 @@ def main(doc):  # IGNORE:W0621
         
     c4d.StopAllThreads()
     
+    # look up groups left over from previous runs in a 
+    # single scene walk instead of a search per object
+    existing = NameIndex(doc)
+    
     # loop through all objects
     for op in sel:
         if not isinstance(op, c4d.PolygonObject):
@@ -109,9 +114,11 @@ def main(doc):  # IGNORE:W0621
         op_mg = op.GetMg()
         op_name = op.GetName()
 
+        base = "x"
+        axis = AXIS_ZY 
+
         pgrp_name = "%s - Polygon #s" % op_name
-        pgrp = doc.SearchObject(pgrp_name)
-        if pgrp:
+        for pgrp in existing.entries.pop(pgrp_name, []):
             pgrp.Remove()
 
         for ply in plys:
@@ -154,23 +161,22 @@ def main(doc):  # IGNORE:W0621
                 else:
                     cv = cva
 
-            AXIS_ZY = 1
-
-            base = "x"
-            axis = AXIS_ZY 
-
             if DEBUG: 
                 print("pids = %r" % pids)
                 print("%d: %s, points as list<list>:" % (ply, poly))
                 print("%s" % (PPLLString(PolyToListList(poly, op))))
             
-            # calculate polygon normals
-            pnormal = CalcPolyNormal(poly, op)
+            # pass the polygon's points instead of the polygon itself 
+            # so CalcPolyNCA doesn't fetch all of op's points again 
+            # for every single polygon
+            pverts = [allpoints[i] for i in PolyToList(poly)]
+
+            # calculate polygon normal, centroid and area 
+            pnormal, pcentroid, parea = CalcPolyNCA(pverts, op)
             if DEBUG: print("normal: %s" % (pnormal))
 
-            # calculate polygon area and bounding box 
-            parea = CalcPolyArea(poly, op)
-            pbb = BBox.FromPolygon(poly, op)
+            # calculate polygon bounding box 
+            pbb = BBox.FromPointList(pverts)
             pbb_slen = pbb.size.GetLength()
             parea = (parea / pbb_slen / 2.0) * TEXT_SIZE
             
@@ -181,16 +187,15 @@ def main(doc):  # IGNORE:W0621
             # create text spline objects
             pname = "%d" % ply
 
-            pmark = CreateObject(c4d.Osplinetext, pname)
+            pmark = CreateObject(c4d.Osplinetext, pname, emit_event=False, doc=doc)
             pmark[c4d.PRIM_TEXT_TEXT] = pname    # Text
             pmark[c4d.PRIM_TEXT_HEIGHT] = parea  # Font Height
             pmark[c4d.PRIM_PLANE] = axis         # Orientation
             
-            if GROUP_UNDER:
-                ppos = CalcPolyCentroid(poly, op)
-            else:
+            ppos = pcentroid
+            if not GROUP_UNDER:
                 # put in scene globally and don't group under op
-                ppos = CalcPolyCentroid(poly, op) * op_mg
+                ppos = ppos * op_mg
             
             # match position and orientation
             pmg = BuildMatrix3(pnormal, cv, off=ppos, base=base)
@@ -204,7 +209,7 @@ def main(doc):  # IGNORE:W0621
             pmarks.append(pmark)
         
         # group spline text objects under null for each op
-        pgrp = InsertUnderNull(pmarks, name=pgrp_name)
+        pgrp = InsertUnderNull(pmarks, name=pgrp_name, emit_event=False, doc=doc)
 
         if GROUP_UNDER:
             pgrp.InsertUnder(op)
@@ -136,9 +136,9 @@ class BBox(object):
         if selOnly is True:
             pntsel = obj.GetPointS()
             if pntsel.HostAlive():
-                for i, p in enumerate(allpnts):  # IGNORE:W0612 @UnusedVariable
+                for i, p in enumerate(allpnts):
                     if pntsel.IsSelected(i):
-                        bb.AddPoint(obj.GetPoint(i))
+                        bb.AddPoint(p)
                         bb.np += 1
             else:
                 return bb
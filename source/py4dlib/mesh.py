@@ -343,6 +343,41 @@ def CalcPolyNormal(e, obj):
     return N.GetNormalized()
     
 
+def CalcPolyNCA(e, obj):
+    """ Calculate normal, centroid and area of a planar polygon in one go.
+    
+        Same results as calling :py:func:`CalcPolyNormal`, :py:func:`CalcPolyCentroid`
+        and :py:func:`CalcPolyArea` but the polygon's points are only looked up once 
+        and the area is taken from the length of the unnormalized Newell normal. 
+        
+        :param e: can be ``c4d.CPolygon``, ``list<int>`` representing 
+            point indices, or ``list<c4d.Vector>`` representing a list
+            of points.
+        
+        :return: tuple (normal, centroid, area)
+    """
+    if not isinstance(obj, c4d.PolygonObject):
+        raise TypeError("E: expected c4d.PolygonObject, got %s" % type(obj))
+    if isinstance(e, c4d.CPolygon):
+        lst = PolyToList(e)
+    elif isinstance(e, list):
+        lst = e
+    else:
+        raise TypeError("E: expected c4d.CPolygon or list, got %s" % type(e))
+    lv = GetPointsForIndices(lst, obj)
+    N = c4d.Vector(0,0,0)
+    llen = len(lv)
+    for i in range(llen):
+        vtx = lv[i]
+        vtn = lv[(i+1) % llen]
+        N.x += (vtx.y - vtn.y) * (vtx.z + vtn.z)
+        N.y += (vtx.z - vtn.z) * (vtx.x + vtn.x)
+        N.z += (vtx.x - vtn.x) * (vtx.y + vtn.y)
+    # the length of Newell's normal is twice the polygon's area
+    area = N.GetLength() / 2.0
+    return (N.GetNormalized(), VAvg(lv), area)
+
+
 def CalcVertexNormal(v, idx, obj):
     """ Calculate the vertex normal by averaging surrounding face normals.
         Usually called from a construct like the following:
@@ -446,26 +481,34 @@ def CalcTriangleArea(p, obj):
     return result
 
 
-def CalcPolyArea(p, obj, normalized=False):
-    total = c4d.Vector(0, 0, 0)
-    ply = PolyToList(p)
-    lply = len(ply)
-    if lply < 3:
+def CalcPolyArea(e, obj, normalized=False):
+    """ Calculate the area of a planar polygon.
+    
+        :param e: can be ``c4d.CPolygon``, ``list<int>`` representing 
+            point indices, or ``list<c4d.Vector>`` representing a list
+            of points.
+    """
+    if isinstance(e, c4d.CPolygon):
+        lst = PolyToList(e)
+    elif isinstance(e, list):
+        lst = e
+    else:
+        raise TypeError("E: expected c4d.CPolygon or list, got %s" % type(e))
+    llen = len(lst)
+    if llen < 3:
         return 0
-    allp = obj.GetAllPoints()
-    for i in range(0, lply):
-        v1 = allp[ply[i]]
-        if i is lply-1:
-            v2 = allp[ply[0]]
-        else:
-            v2 = allp[ply[i+1]]
+    lv = GetPointsForIndices(lst, obj)
+    total = c4d.Vector(0, 0, 0)
+    for i in range(llen):
+        v1 = lv[i]
+        v2 = lv[(i+1) % llen]
         prod = v1.Cross(v2)
         if normalized:
             prod.Normalize()
         total.x += prod.x
         total.y += prod.y
         total.z += prod.z
-    normal = UnitNormal(allp[ply[0]], allp[ply[1]], allp[ply[2]])
+    normal = UnitNormal(lv[0], lv[1], lv[2])
     result = total.Dot(normal)
     return abs(result / 2)
 
@@ -520,10 +563,9 @@ def CalcGravityCenter(obj):
     if maxpoints == 0:
         return c4d.Vector(0)
     cg = c4d.Vector(0)
-    scale = 1.0 / maxpoints
-    for c in xrange(0, maxpoints):
-        cg += (obj.GetPoint(c) * scale)
-    return cg
+    for p in obj.GetAllPoints():
+        cg += p
+    return cg * (1.0 / maxpoints)
 
 
 def PolyToList(p):
@@ -15,6 +15,8 @@
 import os
 import re
 
+from array import array
+
 __version__ = (0, 5)
 __date__ = '2012-09-27'
 __updated__ = '2013-08-10'
@@ -36,11 +38,67 @@ except ImportError:
     if TESTRUN == 1:
         pass
 
-from py4dlib.utils import UnescapeUnicode, EscapeUnicode, FuzzyCompareStrings, deprecated
+from py4dlib.utils import UnescapeUnicode, EscapeUnicode, FuzzyCompareStrings, deprecated, cache
 from py4dlib.maths import BBox
 from py4dlib.mesh import CalcGravityCenter
 
 
+def IterateObjects(start_obj, stop_obj=None, children_only=True, startlvl=-1):
+    """
+    Generator over specific objects in the object manager tree.
+    
+    Yields the same ``(op, lvl)`` tuples as :py:class:`ObjectIterator`
+    and takes the same parameters. Prefer this for large hierarchies
+    since it avoids the per-object method dispatch of the iterator class.
+    """
+    # determine depth level within the hierarchy of start_obj
+    op = start_obj
+    while op:
+        startlvl += 1
+        op = op.GetUp()
+    curlvl = startlvl
+    if children_only:
+        stop_objs = [start_obj]
+    else:
+        stop_objs = []
+    if stop_obj and isinstance(stop_obj, list):
+        stop_objs.extend(stop_obj)
+    elif stop_obj and isinstance(stop_obj, c4d.BaseObject):
+        stop_objs.append(stop_obj)
+    op = start_obj
+    if op is None:
+        return
+    if not children_only:
+        yield (op, curlvl)
+    while True:
+        down = op.GetDown()
+        if down:
+            if op.GetNext() in stop_objs or \
+               down in stop_objs:
+                return
+            curlvl += 1
+            op = down
+            yield (op, curlvl)
+            continue
+        if op in stop_objs:
+            return
+        nxt = op.GetNext()
+        up = op.GetUp()
+        # op itself can't be a stop object here: it either was 
+        # tested just above or is a parent tested on the last step
+        while not nxt and up:
+            if up in stop_objs:
+                return
+            curlvl -= 1
+            op = up
+            nxt = op.GetNext()
+            up = op.GetUp()
+        if not nxt or nxt in stop_objs:
+            return
+        op = nxt
+        yield (op, curlvl)
+
+
 class ObjectIterator(object):
     """
     Iterator over specific objects in the object manager tree.
@@ -48,6 +106,8 @@ class ObjectIterator(object):
     Using a depth first traversal scheme, return a tuple in the form
     (op, lvl), where op is a c4d.BaseObject representing the current 
     object and lvl is an integer indicating the current depth level.
+    
+    Thin wrapper around :py:func:`IterateObjects`.
         
     :param start_obj:        the object whose hierarchy should be iterated over
     :param stop_obj:         an object or a list of objects at which traversal 
@@ -60,64 +120,17 @@ class ObjectIterator(object):
     """
     def __init__(self, start_obj, stop_obj=None, children_only=True, startlvl=-1):
         super(ObjectIterator, self).__init__()
-        self.curobj = start_obj
-        # determine depth level within the hierarchy of start_obj
-        op = start_obj
-        while op:
-            startlvl += 1
-            op = op.GetUp()
-        self.curlvl = startlvl
         self.children_only = children_only
-        if children_only:
-            self.stop_objs = [start_obj]
-            self.init = False
-        else:
-            self.stop_objs = []
-            self.init = True
-        if stop_obj and isinstance(stop_obj, list):
-            self.stop_objs.extend(stop_obj)
-        elif stop_obj and isinstance(stop_obj, c4d.BaseObject):
-            self.stop_objs.append(stop_obj)
+        self.gen = IterateObjects(start_obj, stop_obj, children_only, startlvl)
     
     def __iter__(self):
-        return self
+        # hand out the generator itself so for loops 
+        # don't have to go through next() below
+        return self.gen
     
     # next() becomes __next__() in later Pythons
     def next(self):
-        op = self.curobj
-        if self.init is True:
-            self.init = False
-            return (self.curobj, self.curlvl)
-        if op == None:
-            raise StopIteration
-        if op.GetDown():
-            if op.GetNext() in self.stop_objs or \
-               op.GetDown() in self.stop_objs:
-                raise StopIteration
-            self.curlvl += 1
-            self.curobj = op.GetDown()
-            return (self.curobj, self.curlvl)
-        if op in self.stop_objs:
-            raise StopIteration
-        if self.stop_objs is None:
-            while not op.GetNext() and op.GetUp():
-                self.curlvl -= 1
-                op = op.GetUp()
-        else:
-            while not op.GetNext() and op.GetUp():
-                if (op in self.stop_objs) or \
-                   (op.GetUp() in self.stop_objs):
-                    raise StopIteration
-                self.curlvl -= 1
-                op = op.GetUp()
-        if op.GetNext():
-            if op.GetNext() in self.stop_objs:
-                raise StopIteration
-            self.curobj = op.GetNext()
-            return (self.curobj, self.curlvl)            
-        else:
-            raise StopIteration
-        return (self.curobj, self.curlvl)
+        return self.gen.next()
 
 
 class ObjectEntry(object):
@@ -146,6 +159,31 @@ class ObjectEntry(object):
         self.curlvl = curlvl
         self.lvl = curlvl
         self.parents = parents
+        # c4d creates a new Python wrapper for the same object on 
+        # every access, so id(op) can't be used. Name and level are 
+        # fixed once the entry is made, so compute the hash only once.
+        self._hash = hash(self.name) ^ curlvl
+    @classmethod
+    def FromIter(cls, op, lvl, parents=None):
+        """
+        Returns a new ObjectEntry for an (op, lvl) tuple 
+        as produced by :py:class:`ObjectIterator`. 
+        
+        Use this when creating many entries while iterating,
+        since the level doesn't have to be looked up again. 
+        
+        :raise ValueError: if lvl is negative.
+        """
+        if lvl < 0:
+            raise ValueError("E: expected lvl >= 0, got %r" % (lvl))
+        return cls(op, lvl, parents)
+    @classmethod
+    def FromObject(cls, op, parents=None):
+        """
+        Returns a new ObjectEntry for op, determining 
+        its level by walking up its parents.
+        """
+        return cls(op, -1, parents)
     def __str__(self):
         return ('%s%s' % 
                 (' ' * 4 * self.lvl, self.name))
@@ -153,7 +191,7 @@ class ObjectEntry(object):
         return ("%s (%s)" % 
                 (self.name, self.op.GetTypeName()))
     def __hash__(self):
-        return hash(self.name) ^ self.lvl
+        return self._hash
     def __cmp__(self, other):
         try:
             return cmp(self.op, other.op)
@@ -194,23 +232,37 @@ class ObjectHierarchy(object):
         self.maxlvl = -1
         sep = '/'
         hierarchy = {}
-        for op, lvl in ObjectIterator(root_obj, children_only=children_only):
+        # flat per-object snapshot of the traversal in parallel 
+        # lists, so PPrint doesn't have to walk the scene again
+        ops = []
+        names = []
+        lvls = array('i')
+        # (lvl, path) of the objects on the current traversal branch,
+        # where path is the key path for that object's children. This
+        # way each object's key can be derived from its parent's key 
+        # instead of walking all the way up the hierarchy again.
+        branch = []
+        for op, lvl in IterateObjects(root_obj, children_only=children_only):
+            while branch and branch[-1][0] >= lvl:
+                branch.pop()
+            opname = op.GetName()
+            if branch and branch[-1][0] == lvl - 1:
+                parent_path = branch[-1][1]
+            else:
+                # parent wasn't visited, e.g. the root object or
+                # an object above root_obj when children_only is False
+                parent_path = self._parentpath(op, sep)
+            if parent_path is None:
+                # top level objects are keyed by their own name
+                parent_path = child_path = opname
+            else:
+                child_path = parent_path + sep + opname
+            branch.append((lvl, child_path))
+            ops.append(op)
+            names.append(opname)
+            lvls.append(lvl)
             if ((filter_type is None) or 
                 (filter_type and op.GetType() == filter_type)):
-                plist = []
-                opp = op
-                i = lvl  # IGNORE:W0612
-                while opp:
-                    opp = opp.GetUp()
-                    if opp:
-                        oppname = opp.GetName()
-                        i -= 1
-                        pentry = oppname
-                        plist.append(pentry)
-                if len(plist) == 0:
-                    plist.append(op.GetName())
-                plist.reverse()
-                parent_path = sep.join(plist)
                 if parent_path not in hierarchy:
                     hierarchy[parent_path] = []
                 hierarchy[parent_path].append(op)
@@ -218,6 +270,22 @@ class ObjectHierarchy(object):
                 self.maxlvl = lvl
         self.sep = sep
         self.entries = hierarchy
+        self.ops = ops
+        self.names = names
+        self.lvls = lvls
+        
+    @staticmethod
+    def _parentpath(op, sep):
+        """ Return the concatenated names of all of op's parents, or None if op is at the top level. """
+        plist = []
+        opp = op.GetUp()
+        while opp:
+            plist.append(opp.GetName())
+            opp = opp.GetUp()
+        if len(plist) == 0:
+            return None
+        plist.reverse()
+        return sep.join(plist)
         
     def _strxform(self):
         result = "{"
@@ -241,14 +309,18 @@ class ObjectHierarchy(object):
         """Print an indented, tree-like representation of an object manager hierarchy."""
         lvl = 0
         total = handled = 0
-        if stop_obj is None and self.children_only:
-            stop_obj = self.root
-        for op, lvl in ObjectIterator(self.root, stop_obj, children_only=self.children_only):
+        if stop_obj is None:
+            # same traversal as when the hierarchy was built
+            walk = zip(self.ops, self.names, self.lvls)
+        else:
+            walk = ((op, op.GetName(), lvl) for op, lvl in 
+                    IterateObjects(self.root, stop_obj, children_only=self.children_only))
+        for op, name, lvl in walk:
             total += 1
             indent = lvl * tabsize * ' '
             if not filter_type or (filter_type and op.GetType() == filter_type):
                 handled += 1
-                print("%s%s" % (indent, op.GetName()))
+                print("%s%s" % (indent, name))
         filtered = (total - handled)
         if total == 1:
             s = ""
@@ -284,39 +356,29 @@ class ObjectHierarchy(object):
         if path[-1] == self.sep:
             path = path[:-1] 
         if '..' in path:
-            comps = path.split(self.sep)
+            # resolve left to right so each '..' 
+            # drops the component preceding it
             resolved_comps = []
-            skip = False
-            for comp in reversed(comps):
+            for comp in path.split(self.sep):
                 if comp == '..':
-                    skip = True
-                    continue
-                if skip:
-                    skip = False
-                    continue
-                resolved_comps.append(comp)
-            resolved_comps.reverse()
+                    if resolved_comps:
+                        resolved_comps.pop()
+                else:
+                    resolved_comps.append(comp)
             path = self.sep.join(resolved_comps)
-        if path[0] == '!': 
-            # hint to take path as a verbatim re pattern
-            pat = path[1:]
-        else:
-            # wildcard version
-            pat = re.escape(path)
-            # go back one escape level
-            pat = path.replace(r'\\', '\\')
-            pat = pat.replace('?', '.').replace('*', '.*?')
+        pat, literal = _ResolvePattern(path, strict)
+        if literal is True:
+            # nothing to expand so the path must match a key verbatim
+            return list(self.entries.get(path, []))
         if strict is True:
-            pat = '^%s$' % pat
-            func = re.match
+            func = pat.match
         else:
-            pat = '%s' % pat
-            func = re.search
+            func = pat.search
         keys = [key for key in list(self.entries.keys()) if 
-                func(pat, UnescapeUnicode(key), flags=re.UNICODE)]
+                func(UnescapeUnicode(key))]
         if DEBUG: 
             print("path = %r" % (path))
-            print("pat = %r" % (pat))     
+            print("pat = %r" % (pat.pattern))     
             print("keys = %r" % (keys)) 
         try:
             for key in keys:
@@ -325,6 +387,93 @@ class ObjectHierarchy(object):
         except KeyError:
             pass
         return results
+
+
+class NameIndex(object):
+    """
+    Snapshot of all objects in a document, indexed by name.
+    
+    Use this instead of repeated :py:func:`FindObjects` or 
+    ``doc.SearchObject()`` calls when many objects need to be 
+    looked up by name, since each of those walks the whole scene.
+    
+    Like :py:class:`ObjectHierarchy` the index does not follow 
+    changes made to the scene after it was created. Call 
+    :py:meth:`Update` to rebuild it.
+    
+    :param doc: the document to index. Defaults to the active document.
+    """
+    def __init__(self, doc=None):
+        super(NameIndex, self).__init__()
+        if doc is None:
+            doc = documents.GetActiveDocument()
+        self.doc = doc
+        self.entries = {}
+        self.Update()
+    
+    def __repr__(self):
+        return repr(self.entries)
+    
+    def Update(self):
+        """ Rebuild the index from the current state of the document. """
+        entries = {}
+        if self.doc is not None:
+            for op, lvl in IterateObjects(self.doc.GetFirstObject(), children_only=False):  # IGNORE:W0612 @UnusedVariable
+                name = op.GetName()
+                if name not in entries:
+                    entries[name] = []
+                entries[name].append(op)
+        self.entries = entries
+    
+    def Get(self, name):
+        """ Return a list of all objects named 'name', in object manager order. 
+            Returns an empty list if there are none.
+        """
+        return list(self.entries.get(name, []))
+
+
+# characters which make the path given to 
+# ObjectHierarchy.Get() more than a verbatim key 
+_PATH_METACHARS = frozenset('.^$*+?{}[]\\|()')
+
+
+def _IsLiteralPath(path):
+    """ Return True if 'path' is plain ASCII and contains no wildcard 
+        or regular expression syntax, so that it can only ever match a 
+        key path of :py:class:`ObjectHierarchy` verbatim.
+    """
+    for ch in path:
+        if ch in _PATH_METACHARS or ord(ch) > 127:
+            return False
+    return True
+
+
+@cache
+def _ResolvePattern(path, strict=True):
+    """ Turn a key path given to :py:meth:`ObjectHierarchy.Get` into a 
+        compiled regular expression.
+        
+        Batch scripts tend to query the same paths over and over, so 
+        results are cached.
+        
+        :return: tuple (pattern, literal) where literal is True if 
+            'path' can be looked up verbatim, in which case pattern 
+            is None.
+    """
+    if strict is True and path[0] != '!' and _IsLiteralPath(path):
+        return (None, True)
+    if path[0] == '!': 
+        # hint to take path as a verbatim re pattern
+        pat = path[1:]
+    else:
+        # wildcard version
+        pat = re.escape(path)
+        # go back one escape level
+        pat = path.replace(r'\\', '\\')
+        pat = pat.replace('?', '.').replace('*', '.*?')
+    if strict is True:
+        pat = '^%s$' % pat
+    return (re.compile(pat, re.UNICODE), False)
      
           
 def Select(obj):
@@ -341,8 +490,9 @@ def SelectAdd(obj):
     doc.SetActiveObject(obj, c4d.SELECTION_ADD)
     
 
-def SelectGroupMembers(grp):
-    doc = documents.GetActiveDocument()
+def SelectGroupMembers(grp, doc=None):
+    if doc is None:
+        doc = documents.GetActiveDocument()
     for obj in grp:
         # add each group member to the selection 
         # so we can group them in the object manager
@@ -426,28 +576,36 @@ def GetNextObject(obj, stop_objs=None):
     elif stop_objs is None:
         stop_objs = []
     if obj == None: return None
-    if obj.GetDown(): 
-        if (obj.GetNext() in stop_objs or
-            obj.GetDown() in stop_objs):
+    # each Get* call crosses into C4D, so fetch 
+    # the neighbours only once per object
+    down = obj.GetDown()
+    nxt = obj.GetNext()
+    if down: 
+        if (nxt in stop_objs or
+            down in stop_objs):
             return None
-        return obj.GetDown()
+        return down
     if obj in stop_objs:
         return None
+    up = obj.GetUp()
     if len(stop_objs) == 0:
-        while not obj.GetNext() and obj.GetUp():
-            obj = obj.GetUp()
+        while not nxt and up:
+            obj = up
+            nxt = obj.GetNext()
+            up = obj.GetUp()
     else:
-        while (not obj.GetNext() and 
-                   obj.GetUp() and 
-                   obj.GetUp() not in stop_objs):
-            if (obj in stop_objs or
-                obj.GetUp() in stop_objs):
-                return None
-            obj = obj.GetUp()
-    if obj.GetNext() and obj.GetNext() in stop_objs:
+        # neither obj nor any parent we climb to can be 
+        # in stop_objs here, the loop condition ensures that
+        while (not nxt and 
+                   up and 
+                   up not in stop_objs):
+            obj = up
+            nxt = obj.GetNext()
+            up = obj.GetUp()
+    if nxt and nxt in stop_objs:
         return None
     else:
-        return obj.GetNext()
+        return nxt
 
 
 def GetActiveObjects(doc):
@@ -512,44 +670,56 @@ def FindObject(name, start=None, matchfunc=None, *args, **kwargs):
     return result
 
 
-def FindObjects(name=None, uip=None):
+def FindObjects(name=None, uip=None, doc=None):
     """ Find all objects in the scene, either with the name ``name`` 
         and/or the unique IP ``uip``.
+        
+        :param doc: the document to search. Defaults to the active document.
     """
     if name is None and uip is None: 
         return None
     if not isinstance(name, (str, unicode)):
         raise TypeError("E: expected string or unicode, got %s" % type(name))
-    doc = documents.GetActiveDocument()
+    if doc is None:
+        doc = documents.GetActiveDocument()
     if not doc: 
         return None
     result = []
     obj = doc.GetFirstObject()
     if not obj: 
         return result
+    if name and uip:
+        check_name = check_uip = True
+    elif uip and name is None:
+        check_name, check_uip = False, True
+    elif name and uip is None:
+        check_name, check_uip = True, False
+    else:
+        return result
+    # only query what needs comparing and skip the unique 
+    # IP if the name already doesn't match
     while obj:
-        curname = obj.GetName()
-        curip = obj.GetUniqueIP()
-        if name and uip:
-            if curname == name and uip == curip:
-                result.append(obj)
-        elif uip and name is None:
-            if uip == curip:
-                result.append(obj)
-        elif name and uip is None:
-            if name == curname:
-                result.append(obj)
+        if ((not check_name or obj.GetName() == name) and 
+            (not check_uip or obj.GetUniqueIP() == uip)):
+            result.append(obj)
         obj = GetNextObject(obj)
     return result
 
 
-def CreateObject(typ, name, undo=True):
+def CreateObject(typ, name, undo=True, emit_event=True, doc=None):
     """ Create a object of type 'typ', with name 'name'.
         This calls c4d.StopAllThreads() internally.
+        
+        :param bool emit_event: if False, don't call ``c4d.EventAdd()``.
+            Useful when creating many objects in a row, in which case 
+            the caller should call ``c4d.EventAdd()`` once afterwards.
+        :param doc: the document to insert the object into. 
+            Defaults to the active document.
     """
     obj = None
     try:
-        doc = documents.GetActiveDocument()
+        if doc is None:
+            doc = documents.GetActiveDocument()
         if doc is None: return None
         obj = c4d.BaseObject(typ)
         obj.SetName(name)
@@ -557,43 +727,48 @@ def CreateObject(typ, name, undo=True):
         doc.InsertObject(obj)
         if undo is True:
             doc.AddUndo(c4d.UNDOTYPE_NEW, obj)
-        c4d.EventAdd()
+        if emit_event is True:
+            c4d.EventAdd()
     except Exception as e:  # IGNORE:W0703
         print("*** Caught Exception: %r ***" % e)
     return obj
 
 
-def CreateReplaceObject(typ, name):
+def CreateReplaceObject(typ, name, doc=None):
     """ Create object with name 'name' removing and 
         replacing any object with the same name. 
     """
-    doc = c4d.documents.GetActiveDocument()
+    if doc is None:
+        doc = c4d.documents.GetActiveDocument()
     if doc is None:
         return False
     obj = doc.SearchObject(name)
     if obj is not None:
         obj.Remove()
-    obj = CreateObject(typ, name)
+    obj = CreateObject(typ, name, doc=doc)
     return obj
 
 
-def InsertUnderNull(objs, grp=None, name="Group", copy=False):
+def InsertUnderNull(objs, grp=None, name="Group", copy=False, emit_event=True, doc=None):
     """
     Inserts objects under a group (null) object, optionally creating the group.
     
     Note: currently does not reset obj's coordinate frame 
     to that of the new parent.
     
-    objs  BaseObject      can be a single object or a list of objects
-    grp   BaseObject      the group to place the objects under 
-                          (if None a new null object will be created)
-    name  str             name for the new group
-    copy  bool            copy the objects if True
+    objs        BaseObject    can be a single object or a list of objects
+    grp         BaseObject    the group to place the objects under 
+                              (if None a new null object will be created)
+    name        str           name for the new group
+    copy        bool          copy the objects if True
+    emit_event  bool          if False, don't call c4d.EventAdd()
+    doc         BaseDocument  the document to create the group in
+                              (if None the active document is used)
         
     Returns the modyfied/created group on success, None on failure.
     """
     if grp is None:
-        grp = CreateObject(c4d.Onull, name)
+        grp = CreateObject(c4d.Onull, name, emit_event=emit_event, doc=doc)
     if copy == True: 
         objs = [i.GetClone() for i in objs]
     if DEBUG: print("inserting objs into group '%s'" % grp.GetName())
@@ -604,37 +779,49 @@ def InsertUnderNull(objs, grp=None, name="Group", copy=False):
     else:
         objs.Remove()
         objs.InsertUnder(grp)
-    c4d.EventAdd()
+    if emit_event is True:
+        c4d.EventAdd()
     return grp
 
 
 @deprecated(since="0.5")
 def RecursiveInsertGroups(entry, parent, root, tree, pmatch='90%'):
-    if isinstance(entry, dict):
-        for node in entry:
-            nodeobj = None
-            for op, lvl in ObjectIterator(root.op, root.op): # IGNORE:W0612 #@UnusedVariable
-                if op.GetName() == node.name:
-                    nodeobj = op
-            if not nodeobj:
-                nodeobj = CreateObject(c4d.Onull, node.name)
-                nodeobj.InsertUnder(parent.op)
-            return RecursiveInsertGroups(node, node, root, entry, pmatch)
-    elif isinstance(entry, list):
-        for child in entry: # type(child) == <type: TreeEntry> or another dict
-            if isinstance(child, dict):
-                return RecursiveInsertGroups(child, parent, root, tree, pmatch)
+    # look up names in the root hierarchy once instead of 
+    # walking it for each node. The last object wins, just 
+    # like it did with the lookup walk.
+    nodeobjs = dict((op.GetName(), op) for op, lvl in IterateObjects(root.op, root.op)) # IGNORE:W0612 #@UnusedVariable
+    # each recursion step was a tail call, so
+    # loop with updated arguments instead
+    while True:
+        if isinstance(entry, dict):
+            for node in entry:
+                nodeobj = nodeobjs.get(node.name)
+                if not nodeobj:
+                    nodeobj = CreateObject(c4d.Onull, node.name, emit_event=False)
+                    nodeobj.InsertUnder(parent.op)
+                    nodeobjs[node.name] = nodeobj
+                entry, parent, tree = node, node, entry
+                break
             else:
-                childobj = FindObject(child.name, start=root.op, matchfunc=FuzzyCompareStrings, limit=pmatch)
-                if not childobj:
-                    childobj = CreateObject(c4d.Onull, child.name)
-                childobj.InsertUnder(parent.op)
-    else:
-        children = tree[entry]
-        return RecursiveInsertGroups(children, entry, root, tree, pmatch)
+                break
+        elif isinstance(entry, list):
+            for child in entry: # type(child) == <type: TreeEntry> or another dict
+                if isinstance(child, dict):
+                    entry = child
+                    break
+                else:
+                    childobj = FindObject(child.name, start=root.op, matchfunc=FuzzyCompareStrings, limit=pmatch)
+                    if not childobj:
+                        childobj = CreateObject(c4d.Onull, child.name, emit_event=False)
+                    childobj.InsertUnder(parent.op)
+            else:
+                break
+        else:
+            entry, parent = tree[entry], entry
+    c4d.EventAdd()
 
 
-def UniqueSequentialName(name_base, template=u'%(name)s.%(num)s'):
+def UniqueSequentialName(name_base, template=u'%(name)s.%(num)s', doc=None):
     """ Return a new sequential name based on a naming template and a 
         base name such that the name uniquely identifies an object in 
         the scene.
@@ -649,12 +836,20 @@ def UniqueSequentialName(name_base, template=u'%(name)s.%(num)s'):
             Cube.12
             
         the function would return ``Cube.13`` as a new name.
+        
+        :param doc: the document the name should be unique in. 
+            Defaults to the active document.
     """
-    doc = c4d.documents.GetActiveDocument()
+    if doc is None:
+        doc = c4d.documents.GetActiveDocument()
     if doc is None:
         return False
-    oh = ObjectHierarchy()
-    objs = oh.Get(r"!" + name_base + r".*?\d*")
+    firstobj = doc.GetFirstObject()
+    if firstobj is None:
+        objs = []
+    else:
+        oh = ObjectHierarchy(firstobj, children_only=False)
+        objs = oh.Get(r"!" + name_base + r".*?\d*")
     nums = []
     for obj in objs:
         name = obj.GetName()
@@ -716,10 +911,12 @@ def SetGlobalRotation(obj, rot):
 
     m = c4d.utils.HPBToMatrix(rot)
 
+    # HPBToMatrix returns an orthonormal matrix 
+    # so there is no need to normalize the axes
     m.off = pos
-    m.v1 = m.v1.GetNormalized() * scale.x
-    m.v2 = m.v2.GetNormalized() * scale.y
-    m.v3 = m.v3.GetNormalized() * scale.z
+    m.v1 = m.v1 * scale.x
+    m.v2 = m.v2 * scale.y
+    m.v3 = m.v3 * scale.z
 
     obj.SetMg(m)
 
@@ -755,9 +952,7 @@ def SetAxisRotation(obj, rot, local=False):
     else:
         mat = obj.GetMg()
     inv = ~mat  
-    points = obj.GetAllPoints()
-    for i in range(len(points)):
-        points[i] = points[i] * inv
+    points = [p * inv for p in obj.GetAllPoints()]
     obj.SetAllPoints(points)
     obj.Message(c4d.MSG_UPDATE)
     c4d.EventAdd()
@@ -803,8 +998,10 @@ def CenterObjectAxis(obj, center="midpoint"):
     # positions
     obj.SetRelPos(c)
     
-    for p in xrange(0, maxpoints):
-        obj.SetPoint(p, obj.GetPoint(p) - trans)
+    # fetch and store all points in one go instead of 
+    # calling GetPoint/SetPoint for every single vertex
+    allp = obj.GetAllPoints()
+    obj.SetAllPoints([p - trans for p in allp])
     # compensate positions of child objects
     child = obj.GetDown()
     while child:
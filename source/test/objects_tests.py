@@ -154,6 +154,18 @@ class ObjectsTest(unittest.TestCase):
         actual = self.mockobj.Get(path)
         self.assertEqual(actual, expected, 'actual should equal %r, but is %r' % (expected, actual))
 
+    def testGetRepeatedRelativeExpandedKeyPath(self):
+        expected = ['Cube3', 'W\ürfel3', 'Group1ACA']
+        path = 'Target/Group1/Group1A/Group1AB/Group1ABA/../../Group1AC'
+        actual = self.mockobj.Get(path)
+        self.assertEqual(actual, expected, 'actual should equal %r, but is %r' % (expected, actual))
+
+    def testGetUnknownKeyPath(self):
+        expected = []
+        path = 'Target/Group1/Group2'
+        actual = self.mockobj.Get(path)
+        self.assertEqual(actual, expected, 'actual should equal %r, but is %r' % (expected, actual))
+
 
 if __name__ == "__main__":
     #import sys;sys.argv = ['', 'Test.testName']